@@ -1,9 +1,13 @@
 """Data analysis functions for library data."""
 
+import numpy as np
 import pandas as pd
 from models.library import Library
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+# First years of the mid-century, modern and contemporary age categories
+AGE_CATEGORY_BOUNDARIES = np.array([1950, 1980, 2000])
 
 class LibraryAnalyzer:
     """Analyze library data and generate insights."""
@@ -14,74 +18,94 @@ class LibraryAnalyzer:
     
     def library_to_dataframe(self, library: Library) -> pd.DataFrame:
         """Convert library data to a Pandas DataFrame."""
-        data = {
-            'title': [book.title for book in library.books],
-            'author': [book.author for book in library.books],
-            'year': [book.year for book in library.books]
-        }
-        return pd.DataFrame(data)
+        columns = library.columnar
+        # Copy the read-only cached columns so callers can modify the frame freely
+        return pd.DataFrame({'title': columns.titles, 'author': columns.authors, 'year': columns.years})
     
-    def basic_statistics(self, library: Library) -> Dict[str, Any]:
-        """Generate basic statistics about the library."""
-        df = self.library_to_dataframe(library)
+    def basic_statistics(self, library: Library, df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """Generate basic statistics about the library, reusing ``df`` if given."""
+        if df is None:
+            df = self.library_to_dataframe(library)
+        
+        books_per_author = library.get_books_count_by_author()
+        
+        # Reduce on the raw array; per-call pandas overhead dominates for small libraries
+        years = df['year'].to_numpy()
+        if years.size:
+            earliest, latest = years.min(), years.max()
+            average, median = round(years.mean(), 1), np.median(years)
+        else:
+            earliest = latest = average = median = float('nan')
         
         stats = {
             'library_name': library.name,
             'total_books': len(library.books),
-            'unique_authors': df['author'].nunique(),
+            'unique_authors': len(books_per_author),
             'year_range': {
-                'earliest': df['year'].min(),
-                'latest': df['year'].max()
+                'earliest': earliest,
+                'latest': latest
             },
-            'average_publication_year': round(df['year'].mean(), 1),
-            'median_publication_year': df['year'].median(),
-            'books_per_author': library.get_books_count_by_author()
+            'average_publication_year': average,
+            'median_publication_year': median,
+            'books_per_author': books_per_author
         }
         
         return stats
     
-    def decade_analysis(self, library: Library) -> Dict[str, int]:
+    def decade_analysis(self, library: Library, df: Optional[pd.DataFrame] = None) -> Dict[str, int]:
         """Analyze books by decade."""
-        df = self.library_to_dataframe(library)
-        df['decade'] = (df['year'] // 10) * 10
-        decade_counts = df['decade'].value_counts().sort_index()
+        if df is None:
+            df = self.library_to_dataframe(library)
+        decades = df['year'].to_numpy(dtype=np.int64) // 10
+        if not decades.size:
+            return {}
         
-        return {f"{decade}s": count for decade, count in decade_counts.items()}
+        # Counting from the earliest decade keeps the result ordered by decade
+        first_decade = decades.min()
+        decade_counts = np.bincount(decades - first_decade)
+        
+        return {
+            f"{(first_decade + offset) * 10}s": count
+            for offset, count in enumerate(decade_counts.tolist())
+            if count
+        }
     
-    def age_analysis(self, library: Library) -> Dict[str, Any]:
+    def age_analysis(self, library: Library, df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """Analyze books by age categories."""
-        df = self.library_to_dataframe(library)
-        df['age'] = self.current_year - df['year']
+        if df is None:
+            df = self.library_to_dataframe(library)
+        years = df['year'].to_numpy()
+        titles = df['title'].to_numpy()
+        oldest, newest = years.argmin(), years.argmax()
         
-        # Define age categories
-        classic = df[df['year'] < 1950]
-        mid_century = df[(df['year'] >= 1950) & (df['year'] < 1980)]
-        modern = df[(df['year'] >= 1980) & (df['year'] < 2000)]
-        contemporary = df[df['year'] >= 2000]
+        # Bucket every year into its age category in one pass
+        categories = np.searchsorted(AGE_CATEGORY_BOUNDARIES, years, side='right')
+        classic, mid_century, modern, contemporary = np.bincount(categories, minlength=4).tolist()
         
         return {
-            'classic_books': len(classic),
-            'mid_century_books': len(mid_century),
-            'modern_books': len(modern),
-            'contemporary_books': len(contemporary),
-            'average_age': round(df['age'].mean(), 1),
+            'classic_books': classic,
+            'mid_century_books': mid_century,
+            'modern_books': modern,
+            'contemporary_books': contemporary,
+            'average_age': round((self.current_year - years).mean(), 1),
             'oldest_book': {
-                'title': df.loc[df['year'].idxmin(), 'title'],
-                'year': df['year'].min(),
-                'age': self.current_year - df['year'].min()
+                'title': titles[oldest],
+                'year': years[oldest],
+                'age': self.current_year - years[oldest]
             },
             'newest_book': {
-                'title': df.loc[df['year'].idxmax(), 'title'],
-                'year': df['year'].max(),
-                'age': self.current_year - df['year'].max()
+                'title': titles[newest],
+                'year': years[newest],
+                'age': self.current_year - years[newest]
             }
         }
     
     def generate_report(self, library: Library) -> str:
         """Generate a comprehensive analysis report."""
-        basic_stats = self.basic_statistics(library)
-        decade_stats = self.decade_analysis(library)
-        age_stats = self.age_analysis(library)
+        df = self.library_to_dataframe(library)
+        basic_stats = self.basic_statistics(library, df)
+        decade_stats = self.decade_analysis(library, df)
+        age_stats = self.age_analysis(library, df)
         
         report = f"""
 📚 LIBRARY ANALYSIS REPORT
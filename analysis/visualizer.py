@@ -1,10 +1,28 @@
 """Data visualization functions for library data."""
 
+import logging
+import multiprocessing
+import os
 import matplotlib.pyplot as plt
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from models.library import Library
 from analysis.data_analyzer import LibraryAnalyzer
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Plot methods run by create_all_visualizations, in order
+PLOT_METHODS = ('plot_publication_years', 'plot_books_by_decade', 'plot_comprehensive_analysis')
+
+def _render_plot(plot_method: str, library_data: dict, output_dir: str, save: bool) -> None:
+    """Render a single plot headlessly in a worker process."""
+    library = Library.model_validate(library_data)
+    with LibraryVisualizer(output_dir) as visualizer:
+        getattr(visualizer, plot_method)(library, save=save, show=False)
 
 class LibraryVisualizer:
     """Create visualizations for library data."""
@@ -14,17 +32,57 @@ class LibraryVisualizer:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         self.analyzer = LibraryAnalyzer()
+        self._figures: Dict[str, Figure] = {}
         
         # Set matplotlib style
         plt.style.use('default')
         plt.rcParams['figure.figsize'] = (12, 8)
         plt.rcParams['font.size'] = 10
+        
+        # Figures are laid out with tight_layout, so skip the extra tight-bbox render pass
+        plt.rcParams['savefig.dpi'] = 150
+        plt.rcParams['savefig.bbox'] = 'standard'
+    
+    def __enter__(self) -> "LibraryVisualizer":
+        """Use the visualizer as a context manager that closes its figures on exit."""
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the figures when leaving the context."""
+        self.close()
+    
+    def _get_figure(self, layout: str, nrows: int, ncols: int, figsize: Tuple[int, int],
+                    interactive: bool) -> Tuple[Figure, Any]:
+        """Return a figure for the layout, clearing and reusing the previous headless one.
+        
+        Interactive figures are always new pyplot figures, so one still on screen is never
+        redrawn; headless ones skip pyplot and render straight to Agg.
+        """
+        if interactive:
+            fig = plt.figure(figsize=figsize)
+        else:
+            fig = self._figures.get(layout)
+            if fig is None:
+                fig = Figure(figsize=figsize)
+                FigureCanvasAgg(fig)
+                self._figures[layout] = fig
+            else:
+                fig.clear()
+        return fig, fig.subplots(nrows, ncols)
+    
+    def close(self) -> None:
+        """Close the headless figures held by the visualizer."""
+        for fig in self._figures.values():
+            plt.close(fig)
+        self._figures.clear()
     
-    def plot_publication_years(self, library: Library, save: bool = True, show: bool = True) -> None:
+    def plot_publication_years(self, library: Library, save: bool = True, show: bool = True,
+                               df: Optional[pd.DataFrame] = None) -> None:
         """Create histogram of publication years."""
-        df = self.analyzer.library_to_dataframe(library)
+        if df is None:
+            df = self.analyzer.library_to_dataframe(library)
         
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._get_figure('single', 1, 1, figsize=(10, 6), interactive=show)
         
         ax.hist(df['year'], bins=min(10, len(df)), edgecolor='black', alpha=0.7, color='steelblue')
         ax.set_title(f'Distribution of Publication Years - {library.name}', fontsize=14, fontweight='bold')
@@ -38,27 +96,26 @@ class LibraryVisualizer:
                   label=f'Average: {avg_year:.0f}')
         ax.legend()
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save:
             filename = self.output_dir / f"{library.name.replace(' ', '_')}_years_histogram.png"
-            plt.savefig(filename, dpi=300, bbox_inches='tight')
-            print(f"✅ Histogram saved to {filename}")
+            fig.savefig(filename)
+            logger.info("✅ Histogram saved to %s", filename)
         
         if show:
             plt.show()
-        else:
-            plt.close()
     
-    def plot_books_by_decade(self, library: Library, save: bool = True, show: bool = True) -> None:
+    def plot_books_by_decade(self, library: Library, save: bool = True, show: bool = True,
+                             df: Optional[pd.DataFrame] = None) -> None:
         """Create bar chart of books by decade."""
-        decade_stats = self.analyzer.decade_analysis(library)
+        decade_stats = self.analyzer.decade_analysis(library, df)
         
         if not decade_stats:
-            print("❌ No decade data available for visualization")
+            logger.warning("❌ No decade data available for visualization")
             return
         
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._get_figure('single', 1, 1, figsize=(10, 6), interactive=show)
         
         decades = list(decade_stats.keys())
         counts = list(decade_stats.values())
@@ -70,31 +127,27 @@ class LibraryVisualizer:
         ax.tick_params(axis='x', rotation=45)
         
         # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(height)}',
-                   ha='center', va='bottom', fontweight='bold')
+        ax.bar_label(bars, fmt='%d', fontweight='bold')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save:
             filename = self.output_dir / f"{library.name.replace(' ', '_')}_decades_bar.png"
-            plt.savefig(filename, dpi=300, bbox_inches='tight')
-            print(f"✅ Bar chart saved to {filename}")
+            fig.savefig(filename)
+            logger.info("✅ Bar chart saved to %s", filename)
         
         if show:
             plt.show()
-        else:
-            plt.close()
     
-    def plot_comprehensive_analysis(self, library: Library, save: bool = True, show: bool = True) -> None:
+    def plot_comprehensive_analysis(self, library: Library, save: bool = True, show: bool = True,
+                                    df: Optional[pd.DataFrame] = None) -> None:
         """Create a comprehensive multi-plot analysis."""
-        df = self.analyzer.library_to_dataframe(library)
-        age_stats = self.analyzer.age_analysis(library)
-        decade_stats = self.analyzer.decade_analysis(library)
+        if df is None:
+            df = self.analyzer.library_to_dataframe(library)
+        age_stats = self.analyzer.age_analysis(library, df)
+        decade_stats = self.analyzer.decade_analysis(library, df)
         
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._get_figure('quad', 2, 2, figsize=(15, 12), interactive=show)
         fig.suptitle(f'Comprehensive Analysis: {library.name}', fontsize=16, fontweight='bold')
         
         # 1. Publication years histogram
@@ -145,24 +198,40 @@ class LibraryVisualizer:
                     ha='center', va='center', transform=ax4.transAxes, fontsize=12)
             ax4.set_title('Author Distribution')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save:
             filename = self.output_dir / f"{library.name.replace(' ', '_')}_comprehensive_analysis.png"
-            plt.savefig(filename, dpi=300, bbox_inches='tight')
-            print(f"✅ Comprehensive analysis saved to {filename}")
+            fig.savefig(filename)
+            logger.info("✅ Comprehensive analysis saved to %s", filename)
         
         if show:
             plt.show()
-        else:
-            plt.close()
     
-    def create_all_visualizations(self, library: Library, save: bool = True, show: bool = False) -> None:
-        """Create all available visualizations for the library."""
-        print(f"🎨 Creating visualizations for {library.name}...")
-        
-        self.plot_publication_years(library, save=save, show=show)
-        self.plot_books_by_decade(library, save=save, show=show)
-        self.plot_comprehensive_analysis(library, save=save, show=show)
+    def create_all_visualizations(self, library: Library, save: bool = True, show: bool = False,
+                                  parallel: bool = False) -> None:
+        """Create all available visualizations for the library.
+        
+        When the plots are not shown interactively they are independent, so with
+        ``parallel`` each one is rendered in its own process on multi-core machines.
+        """
+        logger.info("🎨 Creating visualizations for %s...", library.name)
+        
+        if parallel and not show and (os.cpu_count() or 1) > 1:
+            # Never fork: the Gemini SDK may already be running grpc threads in this process
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            library_data = library.model_dump()
+            with ProcessPoolExecutor(max_workers=len(PLOT_METHODS),
+                                     mp_context=multiprocessing.get_context(start_method)) as executor:
+                futures = [
+                    executor.submit(_render_plot, plot_method, library_data, str(self.output_dir), save)
+                    for plot_method in PLOT_METHODS
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            df = self.analyzer.library_to_dataframe(library)
+            for plot_method in PLOT_METHODS:
+                getattr(self, plot_method)(library, save=save, show=show, df=df)
         
-        print("✅ All visualizations created successfully!")
\ No newline at end of file
+        logger.info("✅ All visualizations created successfully!")
\ No newline at end of file
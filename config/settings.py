@@ -40,6 +40,16 @@ class Settings:
         """Get maximum tokens for API requests."""
         return int(os.getenv("MAX_TOKENS", "1000"))
     
+    @property
+    def transport(self) -> Optional[str]:
+        """Get the Gemini SDK transport ('grpc' or 'rest'); None keeps the SDK default."""
+        return os.getenv("GEMINI_TRANSPORT") or None
+    
+    @property
+    def request_timeout(self) -> float:
+        """Get the timeout in seconds for a single Gemini request, retries included."""
+        return float(os.getenv("REQUEST_TIMEOUT", "60"))
+    
     @property
     def output_dir(self) -> str:
         """Get output directory for generated files."""
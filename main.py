@@ -1,11 +1,13 @@
 """Basic example of using the Gemini-Pydantic integration."""
 
+import logging
 from services.data_processor import DataProcessor
 from utils.file_manager import FileManager
 from analysis.data_analyzer import LibraryAnalyzer
 
 def main():
     """Run basic example workflow."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("🚀 Basic Gemini-Pydantic Example")
     print("=" * 40)
     
@@ -1,8 +1,34 @@
 """Pydantic models for library and book data."""
 
-from pydantic import BaseModel, Field
-from typing import List
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import from_json
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
+from functools import wraps
+
+ViewT = TypeVar('ViewT')
+
+# Cached properties on Library that are derived from its books
+_BOOK_VIEWS = ('_authors_lower', 'columnar')
+
+def _book_view(build: Callable[["Library"], ViewT]) -> property:
+    """Cache a view of the books, rebuilding it when books are added, removed or replaced."""
+    name = build.__name__
+    
+    @wraps(build)
+    def view(self: "Library") -> ViewT:
+        # Holding the books themselves keeps their ids from being reused by new objects
+        snapshot = tuple(self.books)
+        cached = self.__dict__.get(name)
+        if cached is None or cached[0] != snapshot:
+            cached = (snapshot, build(self))
+            self.__dict__[name] = cached
+        return cached[1]
+    
+    return property(view)
 
 class Book(BaseModel):
     """Pydantic model for a book with validation."""
@@ -15,53 +41,130 @@ class Book(BaseModel):
         description="Publication year must be between 1000 and current year"
     )
     
-    class Config:
-        str_strip_whitespace = True
-        validate_assignment = True
-        
+    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
+    
     def __str__(self) -> str:
         """String representation of the book."""
         return f"'{self.title}' by {self.author} ({self.year})"
 
+@dataclass(frozen=True, eq=False)
+class LibraryColumnar:
+    """Column-oriented, read-only view of a library's books, compared by identity."""
+    
+    titles: np.ndarray
+    authors: np.ndarray
+    years: np.ndarray
+    
+    @classmethod
+    def from_books(cls, books: List[Book]) -> "LibraryColumnar":
+        """Build the columns in a single pass over the books."""
+        count = len(books)
+        titles = np.empty(count, dtype=object)
+        authors = np.empty(count, dtype=object)
+        years = np.empty(count, dtype=np.int64)
+        for i, book in enumerate(books):
+            titles[i], authors[i], years[i] = book.title, book.author, book.year
+        for column in (titles, authors, years):
+            column.flags.writeable = False
+        return cls(titles=titles, authors=authors, years=years)
+
 class Library(BaseModel):
-    """Pydantic model for a library containing books."""
+    """Pydantic model for a library containing books.
+    
+    Views derived from the books are cached and follow changes to the list itself. After
+    editing a book's fields in place, reassign ``library.books = library.books`` to refresh them.
+    """
     
     name: str = Field(min_length=1, description="Library name cannot be empty")
     books: List[Book] = Field(description="List of books in the library")
     
-    class Config:
-        str_strip_whitespace = True
-        validate_assignment = True
+    model_config = ConfigDict(str_strip_whitespace=True, validate_assignment=True)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping cached views derived from the books."""
+        super().__setattr__(name, value)
+        if name == 'books':
+            self._drop_book_views()
+    
+    def __eq__(self, other: Any) -> bool:
+        """Compare libraries by their fields, ignoring cached book views."""
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.name == other.name and self.books == other.books
+    
+    def __copy__(self) -> "Library":
+        """Shallow copy that starts without cached book views."""
+        copied = super().__copy__()
+        copied._drop_book_views()
+        return copied
+    
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "Library":
+        """Deep copy that starts without cached book views."""
+        copied = super().__deepcopy__(memo)
+        copied._drop_book_views()
+        return copied
+    
+    def _drop_book_views(self) -> None:
+        """Forget every cached view derived from the books."""
+        for view in _BOOK_VIEWS:
+            self.__dict__.pop(view, None)
     
     def __str__(self) -> str:
         """String representation of the library."""
         return f"{self.name} ({len(self.books)} books)"
     
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> "Library":
+        """Build a Library from already-validated data, skipping validation."""
+        books = [Book.model_construct(**book) for book in data['books']]
+        return cls.model_construct(name=data['name'], books=books)
+    
+    @classmethod
+    def from_trusted_json(cls, json_data: Union[str, bytes]) -> "Library":
+        """Build a Library from JSON we produced ourselves, skipping validation."""
+        return cls.from_trusted_dict(from_json(json_data))
+    
+    @property
+    def _author_counts(self) -> Counter:
+        """Book count per author, counted on each call since it is a single cheap pass."""
+        return Counter(book.author for book in self.books)
+    
+    @_book_view
+    def columnar(self) -> LibraryColumnar:
+        """Columnar view of the books, reused by every analysis until the books change."""
+        return LibraryColumnar.from_books(self.books)
+    
+    @_book_view
+    def _authors_lower(self) -> np.ndarray:
+        """Lower-cased author names as an array aligned with the books."""
+        return np.array([author.lower() for author in self.columnar.authors], dtype=object)
+    
+    def _select(self, mask: np.ndarray) -> List[Book]:
+        """Get the books at the positions where the mask is set."""
+        return [self.books[i] for i in np.flatnonzero(mask)]
+    
     def get_books_by_author(self, author: str) -> List[Book]:
         """Get all books by a specific author."""
-        return [book for book in self.books if book.author.lower() == author.lower()]
+        return self._select(self._authors_lower == author.lower())
     
     def get_books_after_year(self, year: int) -> List[Book]:
         """Get all books published after a specific year."""
-        return [book for book in self.books if book.year > year]
+        return self._select(self.columnar.years > year)
     
     def get_books_before_year(self, year: int) -> List[Book]:
         """Get all books published before a specific year."""
-        return [book for book in self.books if book.year < year]
+        return self._select(self.columnar.years < year)
     
     def get_average_publication_year(self) -> float:
         """Calculate average publication year of all books."""
         if not self.books:
             return 0.0
-        return sum(book.year for book in self.books) / len(self.books)
+        return float(self.columnar.years.mean())
     
     def get_unique_authors(self) -> List[str]:
         """Get list of unique authors in the library."""
-        return list(set(book.author for book in self.books))
+        return list(self._author_counts)
     
     def get_books_count_by_author(self) -> dict[str, int]:
         """Get count of books per author."""
-        author_counts = {}
-        for book in self.books:
-            author_counts[book.author] = author_counts.get(book.author, 0) + 1
-        return author_counts
\ No newline at end of file
+        return dict(self._author_counts)
\ No newline at end of file
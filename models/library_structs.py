@@ -0,0 +1,34 @@
+"""Optional msgspec structs mirroring the library models for fast JSON decoding.
+
+Requires the optional ``msgspec`` package; importing this module raises ImportError without it.
+"""
+
+import msgspec
+from datetime import datetime
+from typing import Annotated, List, Union
+from models.library import Library
+
+NonEmptyStr = Annotated[str, msgspec.Meta(min_length=1)]
+
+class BookStruct(msgspec.Struct):
+    """msgspec counterpart of Book with the same field constraints."""
+
+    title: NonEmptyStr
+    author: NonEmptyStr
+    year: Annotated[int, msgspec.Meta(gt=1000, le=datetime.now().year)]
+
+class LibraryStruct(msgspec.Struct):
+    """msgspec counterpart of Library with the same field constraints."""
+
+    name: NonEmptyStr
+    books: List[BookStruct]
+
+_library_decoder = msgspec.json.Decoder(LibraryStruct)
+
+def decode_library_json(json_data: Union[str, bytes]) -> Library:
+    """Decode and check JSON with msgspec, then build the Library without re-validating.
+
+    msgspec does not strip whitespace, so this suits files written by this application.
+    """
+    struct = _library_decoder.decode(json_data)
+    return Library.from_trusted_dict(msgspec.to_builtins(struct))
@@ -1,10 +1,12 @@
 """Data processing utilities for library data."""
 
+import logging
 from models.library import Library, Book
 from utils.json_cleaner import JSONCleaner
 from services.gemini_client import GeminiClient
-from typing import Optional
-import json
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
 
 class DataProcessor:
     """Process and validate library data from Gemini responses."""
@@ -14,42 +16,49 @@ class DataProcessor:
         self.gemini_client = GeminiClient()
         self.json_cleaner = JSONCleaner()
     
-    def generate_and_parse_library(self, num_books: int = 5) -> Optional[Library]:
+    def generate_and_parse_library(self, num_books: int = 5, use_cache: bool = False) -> Optional[Library]:
         """Complete workflow: Generate -> Clean -> Validate -> Return Library."""
         
-        print(f"🔄 Generating library data with {num_books} books...")
+        logger.info("🔄 Generating library data with %s books...", num_books)
         
         # Step 1: Generate raw data from Gemini
-        raw_response = self.gemini_client.generate_library_data(num_books)
+        raw_response = self.gemini_client.generate_library_data(num_books, use_cache=use_cache)
         if not raw_response:
-            print("❌ Failed to generate data from Gemini")
+            logger.error("❌ Failed to generate data from Gemini")
             return None
         
         # Step 2: Clean and validate JSON
         try:
             cleaned_json = self.json_cleaner.clean_json_response(raw_response)
-            print("✅ JSON cleaned successfully")
+            logger.info("✅ JSON cleaned successfully")
             
             # Step 3: Parse and validate with Pydantic
             library = Library.model_validate_json(cleaned_json)
-            print("✅ Data validated and parsed successfully!")
+            logger.info("✅ Data validated and parsed successfully!")
             
             return library
             
         except Exception as e:
-            print(f"❌ Error processing data: {e}")
-            print(f"Raw response: {raw_response}")
+            logger.error("❌ Error processing data: %s\nRaw response: %s", e, raw_response)
             return None
     
-    def parse_json_to_library(self, json_string: str) -> Optional[Library]:
-        """Parse a JSON string directly to Library object."""
+    def parse_json_to_library(self, json_string: Union[str, bytes]) -> Optional[Library]:
+        """Parse a JSON string or UTF-8 bytes directly to Library object."""
         try:
             cleaned_json = self.json_cleaner.clean_json_response(json_string)
             library = Library.model_validate_json(cleaned_json)
-            print("✅ Successfully parsed JSON to Library object")
+            logger.info("✅ Successfully parsed JSON to Library object")
             return library
         except Exception as e:
-            print(f"❌ Error parsing JSON: {e}")
+            logger.error("❌ Error parsing JSON: %s", e)
+            return None
+    
+    def parse_trusted_json(self, json_string: Union[str, bytes]) -> Optional[Library]:
+        """Parse JSON saved by this application without re-running validation."""
+        try:
+            return Library.from_trusted_json(json_string)
+        except Exception as e:
+            logger.error("❌ Error parsing trusted JSON: %s", e)
             return None
     
     def library_to_dict(self, library: Library) -> dict:
@@ -1,76 +1,173 @@
 """Gemini API client for generating structured data."""
 
-import google.generativeai as genai
-from typing import Optional
+import logging
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 from config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
+
+# A single prompt string, or a sequence of prompt parts sent as one message
+Prompt = Union[str, Tuple[str, ...]]
+
+# Library prompt text that does not depend on the number of books
+_LIBRARY_PROMPT_PREFIX = """
+Generate a JSON object representing a library with the following structure:
+- A name (string) - make it creative and interesting
+- A list of books (the exact count is given at the end), where each book has:
+  - title (string)
+  - author (string)
+  - year (integer between 1000 and 2025)
+
+Include books from different time periods and genres for variety.
+
+IMPORTANT: Return ONLY the raw JSON, no backticks, no markdown formatting, no additional text.
+
+Example format:
+{
+    "name": "The Grand Library",
+    "books": [
+        {"title": "Example Title", "author": "Example Author", "year": 1999}
+    ]
+}
+"""
+
+_configured = False
+
+def _configure() -> None:
+    """Configure the Gemini SDK once per process."""
+    global _configured
+    if not _configured:
+        # Imported lazily: the SDK pulls in grpc and protobuf, which most callers never need
+        import google.generativeai as genai
+
+        genai.configure(api_key=settings.api_key, transport=settings.transport)
+        _configured = True
+
+@lru_cache(maxsize=4)
+def _get_model(model_name: str) -> "genai.GenerativeModel":
+    """Get the shared model for a model name, so its API channel is reused."""
+    _configure()
+    import google.generativeai as genai
+    return genai.GenerativeModel(model_name)
+
+def _request_options() -> dict:
+    """Request options that bound each call, retries and backoff included, by the request timeout."""
+    from google.api_core.retry import Retry
+    
+    timeout = settings.request_timeout
+    # Transient errors are retried with exponential backoff until the timeout runs out
+    return {
+        'timeout': timeout,
+        'retry': Retry(initial=1.0, maximum=10.0, multiplier=2.0, timeout=timeout),
+    }
+
+class _EmptyResponseError(ValueError):
+    """Raised when Gemini returns no text for a prompt."""
+
+def _generate_text(model: "genai.GenerativeModel", prompt: Prompt) -> str:
+    """Send a prompt to the model and return the raw response text."""
+    contents = list(prompt) if isinstance(prompt, tuple) else prompt
+    response = model.generate_content(contents, request_options=_request_options())
+    if not (response and response.text):
+        raise _EmptyResponseError("No response received from Gemini")
+    return response.text
+
+@lru_cache(maxsize=256)
+def _generate_cached(model_name: str, prompt: Prompt) -> str:
+    """Generate text for a prompt, memoized so repeated prompts skip the API call."""
+    return _generate_text(_get_model(model_name), prompt)
+
 class GeminiClient:
-    """Client for interacting with Google's Gemini API."""
+    """Client for interacting with Google's Gemini API.
+    
+    Clients share one configured model per model name, and with it one long-lived
+    API channel, so creating many clients is cheap and a single client can safely
+    be shared across threads.
+    """
     
     def __init__(self):
         """Initialize the Gemini client."""
-        genai.configure(api_key=settings.api_key)
-        self.model = genai.GenerativeModel(settings.model_name)
+        self.model_name = settings.model_name
+        self.model = _get_model(self.model_name)
     
     def test_connection(self) -> bool:
         """Test the Gemini API connection."""
         try:
-            response = self.model.generate_content("Hello, Gemini! Please respond with 'Connection successful!'")
+            response = self.model.generate_content(
+                "Hello, Gemini! Please respond with 'Connection successful!'",
+                request_options=_request_options()
+            )
             if response and response.text:
-                print("✅ Connection successful!")
-                print(f"Response: {response.text}")
+                logger.info("✅ Connection successful!")
+                logger.info("Response: %s", response.text)
                 return True
             else:
-                print("❌ No response received")
+                logger.error("❌ No response received")
                 return False
         except Exception as e:
-            print(f"❌ Connection failed: {e}")
+            logger.error("❌ Connection failed: %s", e)
             return False
     
-    def generate_library_data(self, num_books: int = 5) -> Optional[str]:
-        """Generate library data from Gemini API."""
+    def _generate(self, prompt: Prompt, use_cache: bool) -> Optional[str]:
+        """Generate text for a prompt, serving repeated prompts from the cache if allowed."""
+        try:
+            if use_cache:
+                return _generate_cached(self.model_name, prompt)
+            return _generate_text(self.model, prompt)
+        except _EmptyResponseError:
+            logger.error("❌ No response received from Gemini")
+            return None
+        except Exception as e:
+            logger.error("❌ Error generating content: %s", e)
+            return None
+    
+    def generate_library_data(self, num_books: int = 5, use_cache: bool = False) -> Optional[str]:
+        """Generate library data from Gemini API.
         
-        prompt = f"""
-        Generate a JSON object representing a library with the following structure:
-        - A name (string) - make it creative and interesting
-        - A list of exactly {num_books} books, where each book has:
-          - title (string)
-          - author (string) 
-          - year (integer between 1000 and 2025)
+        Every call asks for a fresh library; pass ``use_cache=True`` to reuse the last one per book count.
+        """
         
-        Include books from different time periods and genres for variety.
+        # Static prefix first and the book count last, so the shared prefix can be cached server-side
+        prompt = (_LIBRARY_PROMPT_PREFIX, f"The library must contain exactly {num_books} books.")
         
-        IMPORTANT: Return ONLY the raw JSON, no backticks, no markdown formatting, no additional text.
+        return self._generate(prompt, use_cache)
+    
+    def generate_custom_prompt(self, prompt: str, use_cache: bool = False) -> Optional[str]:
+        """Generate content from a custom prompt; pass ``use_cache=True`` to reuse earlier responses."""
+        return self._generate(prompt, use_cache)
+    
+    async def generate_many(self, prompts: List[str], concurrency: int = 8) -> List[Optional[str]]:
+        """Generate content for many prompts concurrently, at most ``concurrency`` in flight.
         
-        Example format:
-        {{
-            "name": "The Grand Library",
-            "books": [
-                {{"title": "Example Title", "author": "Example Author", "year": 1999}}
-            ]
-        }}
+        Requests run on a thread pool of their own through the shared model, whose channel
+        is not tied to an event loop. Results keep the order of ``prompts``; failed or empty
+        responses are None.
         """
-        
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=concurrency)
         try:
-            response = self.model.generate_content(prompt)
-            if response and response.text:
-                return response.text.strip()
+            results = await asyncio.gather(
+                *(loop.run_in_executor(executor, _generate_text, self.model, prompt) for prompt in prompts),
+                return_exceptions=True,
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        texts: List[Optional[str]] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error("❌ Error generating content: %s", result)
+                texts.append(None)
             else:
-                print("❌ No response received from Gemini")
-                return None
-        except Exception as e:
-            print(f"❌ Error generating content: {e}")
-            return None
+                texts.append(result)
+        return texts
     
-    def generate_custom_prompt(self, prompt: str) -> Optional[str]:
-        """Generate content from a custom prompt."""
-        try:
-            response = self.model.generate_content(prompt)
-            if response and response.text:
-                return response.text.strip()
-            else:
-                print("❌ No response received from Gemini")
-                return None
-        except Exception as e:
-            print(f"❌ Error generating content: {e}")
-            return None
\ No newline at end of file
+    def generate_many_sync(self, prompts: List[str], concurrency: int = 8) -> List[Optional[str]]:
+        """Blocking wrapper around ``generate_many`` for callers without an event loop."""
+        return asyncio.run(self.generate_many(prompts, concurrency))
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""Tests for the library models."""
+
+from models.library import Book, Library
+
+
+def make_library(name: str = "Test Library") -> Library:
+    """Build a small library for the tests."""
+    return Library(name=name, books=[
+        Book(title="Dune", author="Frank Herbert", year=1965),
+        Book(title="Neuromancer", author="William Gibson", year=1984),
+    ])
+
+
+def test_equality_ignores_cached_views():
+    """Libraries still compare by their fields once their cached views are built."""
+    first, second = make_library(), make_library()
+    for library in (first, second):
+        library.get_books_after_year(1970)
+        library.get_books_by_author("william gibson")
+
+    assert first == second
+    assert first != make_library(name="Other Library")
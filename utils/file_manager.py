@@ -1,10 +1,32 @@
 """File management utilities for the application."""
 
+import logging
+import csv
 import os
-import json
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from pydantic_core import to_json
 from models.library import Library
-from typing import Optional
+from typing import Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+def _write_bytes_atomic(filepath: Path, payload: bytes) -> None:
+    """Write bytes through a unique sibling temp file so readers never see a partial file."""
+    tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.{secrets.token_hex(8)}.tmp")
+    # O_EXCL never reuses another writer's file, and the kernel applies the current umask to 0o666
+    fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            # Flush to disk before the rename, so a crash cannot leave an empty file in place
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 class FileManager:
     """Manage file I/O operations for the application."""
@@ -18,53 +40,113 @@ class FileManager:
         """Save library data to JSON file."""
         try:
             filepath = self.output_dir / filename
-            json_content = library.model_dump_json(indent=4)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(json_content)
+            # Serialize straight to UTF-8 bytes so writing needs no encode pass
+            json_content = to_json(library, indent=2)
+            _write_bytes_atomic(filepath, json_content)
             
-            print(f"✅ Library data saved to {filepath}")
+            logger.info("✅ Library data saved to %s", filepath)
             return True
         except Exception as e:
-            print(f"❌ Error saving JSON file: {e}")
+            logger.error("❌ Error saving JSON file: %s", e)
             return False
     
-    def load_library_json(self, filename: str = "library_data.json") -> Optional[Library]:
-        """Load library data from JSON file."""
+    def load_library_json(
+        self, filename: str = "library_data.json", trusted: bool = False, use_msgspec: bool = False
+    ) -> Optional[Library]:
+        """Load library data from JSON file.
+        
+        Set ``trusted`` for files written by ``save_library_json`` to skip re-validation.
+        Set ``use_msgspec`` to decode and check the file with the optional msgspec package instead.
+        """
         try:
             filepath = self.output_dir / filename
             
-            if not filepath.exists():
-                print(f"❌ File not found: {filepath}")
+            # A single read_bytes call; a missing file surfaces here instead of via an extra stat
+            try:
+                json_content = filepath.read_bytes()
+            except FileNotFoundError:
+                logger.error("❌ File not found: %s", filepath)
                 return None
             
-            with open(filepath, 'r', encoding='utf-8') as f:
-                json_content = f.read()
-            
-            library = Library.model_validate_json(json_content)
-            print(f"✅ Library data loaded from {filepath}")
+            if use_msgspec:
+                # Imported lazily so msgspec stays an optional dependency
+                from models.library_structs import decode_library_json
+                library = decode_library_json(json_content)
+            elif trusted:
+                library = Library.from_trusted_json(json_content)
+            else:
+                library = Library.model_validate_json(json_content)
+            logger.info("✅ Library data loaded from %s", filepath)
             return library
         except Exception as e:
-            print(f"❌ Error loading JSON file: {e}")
+            logger.error("❌ Error loading JSON file: %s", e)
             return None
     
+    def load_libraries(self, filenames: List[str], max_workers: int = 8) -> List[Optional[Library]]:
+        """Load several library JSON files, reading them concurrently.
+        
+        Results follow the order of ``filenames``; files that fail to load are None.
+        """
+        filepaths = [self.output_dir / filename for filename in filenames]
+        
+        def read(filepath: Path) -> Union[bytes, OSError]:
+            try:
+                return filepath.read_bytes()
+            except OSError as e:
+                return e
+        
+        # File reads overlap in the pool; validation stays on this thread
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            contents = list(executor.map(read, filepaths))
+        
+        validate_json = Library.__pydantic_validator__.validate_json
+        libraries: List[Optional[Library]] = []
+        for filepath, json_content in zip(filepaths, contents):
+            if isinstance(json_content, OSError):
+                logger.error("❌ Error loading JSON file %s: %s", filepath, json_content)
+                libraries.append(None)
+                continue
+            try:
+                libraries.append(validate_json(json_content))
+            except Exception as e:
+                logger.error("❌ Error loading JSON file %s: %s", filepath, e)
+                libraries.append(None)
+        
+        logger.info("✅ Loaded %s of %s library files", sum(lib is not None for lib in libraries), len(filepaths))
+        return libraries
+    
     def save_csv(self, data: dict, filename: str = "library_data.csv") -> bool:
         """Save data to CSV file."""
         try:
-            import pandas as pd
-            
             filepath = self.output_dir / filename
-            df = pd.DataFrame(data)
-            df.to_csv(filepath, index=False)
             
-            print(f"✅ CSV data saved to {filepath}")
+            # data maps column names to equal-length value lists
+            columns = list(data.values())
+            if len({len(column) for column in columns}) > 1:
+                raise ValueError("All columns must have the same length")
+            
+            with open(filepath, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f, lineterminator=os.linesep)
+                writer.writerow(data.keys())
+                writer.writerows(zip(*columns))
+            
+            logger.info("✅ CSV data saved to %s", filepath)
             return True
         except Exception as e:
-            print(f"❌ Error saving CSV file: {e}")
+            logger.error("❌ Error saving CSV file: %s", e)
             return False
     
+    def iter_output_files(self) -> Iterator[str]:
+        """Yield the names of the files in the output directory."""
+        # DirEntry caches the file type from the directory listing, so is_file() needs no stat
+        try:
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        yield entry.name
+        except FileNotFoundError:
+            return
+    
     def list_output_files(self) -> list:
         """List all files in the output directory."""
-        if not self.output_dir.exists():
-            return []
-        return [f.name for f in self.output_dir.iterdir() if f.is_file()]
\ No newline at end of file
+        return list(self.iter_output_files())
\ No newline at end of file
@@ -1,43 +1,78 @@
 """Utilities for cleaning JSON responses from LLMs."""
 
-import json
-from typing import Any, Dict
+import re
+from functools import lru_cache
+from typing import Any, Dict, Type, TypeVar, Union
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+JSONText = TypeVar('JSONText', str, bytes)
+
+# Leading whitespace plus an optional ```json / ``` fence and the whitespace after it
+_LEADING_FENCE_RE = re.compile(r'\s*(?:```(?:json)?)?\s*')
+_LEADING_FENCE_BYTES_RE = re.compile(rb'\s*(?:```(?:json)?)?\s*')
+
+# A JSON object is the only value that opens with '{' after optional whitespace
+_OBJECT_START_RE = re.compile(r'\s*\{')
+_OBJECT_START_BYTES_RE = re.compile(rb'\s*\{')
+
+def _require_object(json_string: Union[str, bytes]) -> None:
+    """Reject non-object JSON from its first character, before any parsing."""
+    pattern = _OBJECT_START_BYTES_RE if isinstance(json_string, bytes) else _OBJECT_START_RE
+    if not pattern.match(json_string):
+        raise ValueError("JSON must be an object, not an array or primitive")
+
+def _strip_trailing_whitespace(text: Union[str, bytes], start: int, end: int) -> int:
+    """Move ``end`` back past any whitespace, without going before ``start``."""
+    while end > start and text[end - 1:end].isspace():
+        end -= 1
+    return end
 
 class JSONCleaner:
     """Utility class for cleaning and validating JSON responses."""
     
     @staticmethod
-    def clean_json_response(response_text: str) -> str:
-        """Remove markdown formatting from JSON response."""
+    @lru_cache(maxsize=128)
+    def clean_json_response(response_text: JSONText) -> JSONText:
+        """Remove markdown formatting from JSON response, keeping it as str or bytes."""
         if not response_text:
             raise ValueError("Response text is empty")
         
-        cleaned = response_text.strip()
+        if isinstance(response_text, bytes):
+            fence_re, fence = _LEADING_FENCE_BYTES_RE, b'```'
+        else:
+            fence_re, fence = _LEADING_FENCE_RE, '```'
         
-        # Remove common markdown JSON block formatting
-        if cleaned.startswith('```json'):
-            cleaned = cleaned[7:]  # Remove ```json
-        elif cleaned.startswith('```'):
-            cleaned = cleaned[3:]   # Remove ```
-            
-        if cleaned.endswith('```'):
-            cleaned = cleaned[:-3]  # Remove trailing ```
+        # Find the bounds of the JSON payload first so the text is copied only once
+        start = fence_re.match(response_text).end()
+        end = _strip_trailing_whitespace(response_text, start, len(response_text))
+        if response_text.endswith(fence, start, end):
+            end = _strip_trailing_whitespace(response_text, start, end - 3)
         
-        return cleaned.strip()
+        return response_text[start:end]
     
     @staticmethod
-    def validate_json_structure(json_string: str) -> Dict[str, Any]:
+    def validate_json_structure(json_string: Union[str, bytes]) -> Dict[str, Any]:
         """Validate that the string is valid JSON and return parsed dict."""
+        _require_object(json_string)
         try:
-            parsed = json.loads(json_string)
-            if not isinstance(parsed, dict):
-                raise ValueError("JSON must be an object, not an array or primitive")
-            return parsed
-        except json.JSONDecodeError as e:
+            return from_json(json_string)
+        except ValueError as e:
             raise ValueError(f"Invalid JSON format: {e}")
     
     @staticmethod
-    def clean_and_validate(response_text: str) -> Dict[str, Any]:
-        """Clean JSON response and validate structure in one step."""
+    def clean_and_validate(response_text: Union[str, bytes]) -> Dict[str, Any]:
+        """Clean JSON response and validate structure in one step.
+        
+        Prefer ``clean_and_validate_model`` when the result is headed for a Pydantic model.
+        """
+        cleaned = JSONCleaner.clean_json_response(response_text)
+        return JSONCleaner.validate_json_structure(cleaned)
+    
+    @staticmethod
+    def clean_and_validate_model(response_text: Union[str, bytes], model_cls: Type[ModelT]) -> ModelT:
+        """Clean JSON response and validate it straight into a Pydantic model, parsing it once."""
         cleaned = JSONCleaner.clean_json_response(response_text)
-        return JSONCleaner.validate_json_structure(cleaned)
\ No newline at end of file
+        _require_object(cleaned)
+        return model_cls.model_validate_json(cleaned)
\ No newline at end of file